@@ -38,6 +38,21 @@ static void fill_vec2d_from_numpy(
     }
 }
 
+// Helper: fill a std::vector<float> from a 1D numpy float32 array.
+// Used for the minF/maxF feature-range arguments so they are converted in a
+// single buffer pass instead of per-element py::cast.  With forcecast, plain
+// Python lists keep working; a float32 ndarray passed from the caller is
+// read zero-copy.
+static void fill_vec_from_numpy(
+        py::array_t<float, py::array::c_style | py::array::forcecast> &a,
+        std::vector<float> &vec) {
+    py::buffer_info buf = a.request();
+    if (buf.ndim != 1)
+        throw std::runtime_error("expected a 1D array");
+    float* ptr = static_cast<float*>(buf.ptr);
+    vec.assign(ptr, ptr + buf.shape[0]);
+}
+
 // Helper: invoke Python's gc.collect() to reclaim cyclic garbage.
 // Called after heavy operations that create many temporary Python objects
 // (gymnasium env.step/reset, data conversion, etc.) to prevent memory
@@ -51,7 +66,7 @@ PYBIND11_MODULE(_core, m) {
     // Node
     py::class_<Node>(m, "Node")
     .def(py::init<
-            std::shared_ptr<std::mt19937_64>,
+            std::shared_ptr<RandomEngine>,
             unsigned int,
             std::string,
             unsigned int>(),
@@ -65,16 +80,20 @@ PYBIND11_MODULE(_core, m) {
     .def_readwrite("k_d", &Node::k_d)
     .def_readwrite("used", &Node::used)
     .def_readwrite("traverseCounter", &Node::traverseCounter)
-    // pickle support
+    // pickle support – edges/boundaries/productionRuleParameter are emitted
+    // as contiguous numpy buffers instead of per-element Python ints/floats.
+    // This collapses the many small objects of a node into three flat arrays,
+    // which pickle protocol 5 can then serialise out-of-band (see
+    // utilsModel.storePopulation) without copying.
     .def(py::pickle(
         [](const Node &n) { // __getstate__
             return py::make_tuple(
                 n.id,
                 n.type,
                 n.f,
-                n.edges,
-                n.boundaries,
-                n.productionRuleParameter,
+                py::array_t<int>(n.edges.size(), n.edges.data()),
+                py::array_t<float>(n.boundaries.size(), n.boundaries.data()),
+                py::array_t<float>(n.productionRuleParameter.size(), n.productionRuleParameter.data()),
                 n.k_d,
                 n.used
             );
@@ -84,14 +103,14 @@ PYBIND11_MODULE(_core, m) {
                 throw std::runtime_error("Invalid state for Node!");
 
             Node n(
-                std::make_shared<std::mt19937_64>(std::random_device{}()), // new generator
+                std::make_shared<RandomEngine>(std::random_device{}()), // new generator
                 t[0].cast<unsigned int>(),
                 t[1].cast<std::string>(),
                 t[2].cast<unsigned int>()
             );
 
             n.edges = t[3].cast<std::vector<int>>();
-            n.boundaries = t[4].cast<std::vector<double>>();
+            n.boundaries = t[4].cast<std::vector<float>>();
             n.productionRuleParameter = t[5].cast<std::vector<float>>();
             n.k_d = t[6].cast<std::pair<int, int>>();
             n.used = t[7].cast<bool>();
@@ -103,7 +122,7 @@ PYBIND11_MODULE(_core, m) {
     // Network
     py::class_<Network>(m, "Network")
     .def(py::init<
-            std::shared_ptr<std::mt19937_64>,
+            std::shared_ptr<RandomEngine>,
             unsigned int,
             unsigned int,
             unsigned int,
@@ -159,7 +178,7 @@ PYBIND11_MODULE(_core, m) {
                 throw std::runtime_error("Invalid state for Network!");
 
             Network net(
-                std::make_shared<std::mt19937_64>(std::random_device{}()),
+                std::make_shared<RandomEngine>(std::random_device{}()),
                 t[0].cast<unsigned int>(),
                 t[1].cast<unsigned int>(),
                 t[2].cast<unsigned int>(),
@@ -256,16 +275,14 @@ PYBIND11_MODULE(_core, m) {
         // Functions
         .def(
             "setAllNodeBoundaries",
-            [](Population &p, py::list minF_py, py::list maxF_py)
+            [](Population &p,
+               py::array_t<float, py::array::c_style | py::array::forcecast> minF_py,
+               py::array_t<float, py::array::c_style | py::array::forcecast> maxF_py)
             {
                 std::vector<float> minF;
                 std::vector<float> maxF;
-
-                for (auto item : minF_py)
-                    minF.push_back(item.cast<float>());
-
-                for (auto item : maxF_py)
-                    maxF.push_back(item.cast<float>());
+                fill_vec_from_numpy(minF_py, minF);
+                fill_vec_from_numpy(maxF_py, maxF);
 
                 {
                     py::gil_scoped_release release;
@@ -344,6 +361,13 @@ PYBIND11_MODULE(_core, m) {
                 py::arg("env"), py::arg("dMax"), py::arg("maxSteps"), py::arg("maxConsecutiveP"), py::arg("worstFitness"), py::arg("seeds")
             )
 
+        // Native CartPole fitness: runs entirely in C++ (see Cartpole.hpp),
+        // so evaluating the whole population crosses the FFI boundary once
+        // and performs no Python env.step()/env.reset() calls at all.
+        .def("cartpole", &Population::cartpole,
+             py::call_guard<py::gil_scoped_release>(),
+             py::arg("dMax"), py::arg("penalty"), py::arg("maxSteps"), py::arg("maxConsecutiveP"))
+
         .def("calculateParetoObjectives", &Population::calculateParetoObjectives,
              py::call_guard<py::gil_scoped_release>(),
              py::arg("landingThreshold")=100.0f)
@@ -372,16 +396,15 @@ PYBIND11_MODULE(_core, m) {
              py::arg("probability"), py::arg("sigma"), py::arg("justUsedNodes")=false)
         .def(
             "callBoundaryMutationFractal",
-            [](Population &p, float probability, py::list minF_py, py::list maxF_py, bool justUsedNodes)
+            [](Population &p, float probability,
+               py::array_t<float, py::array::c_style | py::array::forcecast> minF_py,
+               py::array_t<float, py::array::c_style | py::array::forcecast> maxF_py,
+               bool justUsedNodes)
             {
                 std::vector<float> minF;
                 std::vector<float> maxF;
-
-                for (auto item : minF_py)
-                    minF.push_back(item.cast<float>());
-
-                for (auto item : maxF_py)
-                    maxF.push_back(item.cast<float>());
+                fill_vec_from_numpy(minF_py, minF);
+                fill_vec_from_numpy(maxF_py, maxF);
 
                 {
                     py::gil_scoped_release release;
@@ -403,16 +426,15 @@ PYBIND11_MODULE(_core, m) {
              py::arg("upperBoundTraversalCounter")=1.1)
         .def(
             "callAddDelNodes",
-            [](Population &p, py::list minF_py, py::list maxF_py, float junk, bool noElite)
+            [](Population &p,
+               py::array_t<float, py::array::c_style | py::array::forcecast> minF_py,
+               py::array_t<float, py::array::c_style | py::array::forcecast> maxF_py,
+               float junk, bool noElite)
             {
                 std::vector<float> minF;
                 std::vector<float> maxF;
-
-                for (auto item : minF_py)
-                    minF.push_back(item.cast<float>());
-
-                for (auto item : maxF_py)
-                    maxF.push_back(item.cast<float>());
+                fill_vec_from_numpy(minF_py, minF);
+                fill_vec_from_numpy(maxF_py, maxF);
 
                 {
                     py::gil_scoped_release release;
@@ -425,6 +447,114 @@ PYBIND11_MODULE(_core, m) {
             py::arg("noElite")=false
         )
 
+        // Fused generation step: selection, crossover, add/del nodes and edge
+        // mutation run back-to-back inside C++, so the whole operator phase
+        // of a generation is one FFI crossing with the GIL released instead
+        // of four separate binding calls.
+        .def(
+            "evolve",
+            [](Population &p, int N, int E,
+               float crossoverProbability, std::string crossoverType,
+               py::array_t<float, py::array::c_style | py::array::forcecast> minF_py,
+               py::array_t<float, py::array::c_style | py::array::forcecast> maxF_py,
+               float junk, float probInnerNodes, float probStartNode,
+               bool justUsedNodes, int k)
+            {
+                std::vector<float> minF;
+                std::vector<float> maxF;
+                fill_vec_from_numpy(minF_py, minF);
+                fill_vec_from_numpy(maxF_py, maxF);
+
+                {
+                    py::gil_scoped_release release;
+                    p.evolve(N, E, crossoverProbability, crossoverType,
+                             minF, maxF, junk, probInnerNodes, probStartNode,
+                             justUsedNodes, k);
+                }
+            },
+            py::arg("N"),
+            py::arg("E"),
+            py::arg("crossoverProbability"),
+            py::arg("crossoverType"),
+            py::arg("minF"),
+            py::arg("maxF"),
+            py::arg("junk")=0,
+            py::arg("probInnerNodes")=0,
+            py::arg("probStartNode")=0,
+            py::arg("justUsedNodes")=false,
+            py::arg("k")=0
+        )
+
+        // SoA-style flat views: the per-node vectors of the whole population
+        // are concatenated into one contiguous buffer in a single C++ pass.
+        // Offset arrays delimit nodes and individuals, so Python/NumPy code
+        // can snapshot or compare the full population without touching any
+        // Node objects.
+        .def("edgesFlat",
+            [](Population &self) {
+                size_t totalNodes = 0;
+                size_t totalValues = 0;
+                for (const auto& network : self.individuals) {
+                    totalNodes += network.innerNodes.size();
+                    for (const auto& node : network.innerNodes)
+                        totalValues += node.edges.size();
+                }
+                py::array_t<int> values(totalValues);
+                py::array_t<py::ssize_t> nodeOffsets(totalNodes + 1);
+                py::array_t<py::ssize_t> individualOffsets(self.individuals.size() + 1);
+                int* v = values.mutable_data();
+                py::ssize_t* no = nodeOffsets.mutable_data();
+                py::ssize_t* io = individualOffsets.mutable_data();
+                size_t vi = 0, ni = 0;
+                io[0] = 0;
+                no[0] = 0;
+                for (size_t i = 0; i < self.individuals.size(); ++i) {
+                    for (const auto& node : self.individuals[i].innerNodes) {
+                        for (int edge : node.edges)
+                            v[vi++] = edge;
+                        no[++ni] = static_cast<py::ssize_t>(vi);
+                    }
+                    io[i + 1] = static_cast<py::ssize_t>(ni);
+                }
+                return py::make_tuple(values, nodeOffsets, individualOffsets);
+            },
+            "Return (values, nodeOffsets, individualOffsets): all edges of the "
+            "population as one flat int array. Node n owns "
+            "values[nodeOffsets[n]:nodeOffsets[n+1]]; individual i owns nodes "
+            "individualOffsets[i]:individualOffsets[i+1].")
+
+        .def("boundariesFlat",
+            [](Population &self) {
+                size_t totalNodes = 0;
+                size_t totalValues = 0;
+                for (const auto& network : self.individuals) {
+                    totalNodes += network.innerNodes.size();
+                    for (const auto& node : network.innerNodes)
+                        totalValues += node.boundaries.size();
+                }
+                py::array_t<float> values(totalValues);
+                py::array_t<py::ssize_t> nodeOffsets(totalNodes + 1);
+                py::array_t<py::ssize_t> individualOffsets(self.individuals.size() + 1);
+                float* v = values.mutable_data();
+                py::ssize_t* no = nodeOffsets.mutable_data();
+                py::ssize_t* io = individualOffsets.mutable_data();
+                size_t vi = 0, ni = 0;
+                io[0] = 0;
+                no[0] = 0;
+                for (size_t i = 0; i < self.individuals.size(); ++i) {
+                    for (const auto& node : self.individuals[i].innerNodes) {
+                        for (float boundary : node.boundaries)
+                            v[vi++] = boundary;
+                        no[++ni] = static_cast<py::ssize_t>(vi);
+                    }
+                    io[i + 1] = static_cast<py::ssize_t>(ni);
+                }
+                return py::make_tuple(values, nodeOffsets, individualOffsets);
+            },
+            "Return (values, nodeOffsets, individualOffsets): all judgment "
+            "boundaries of the population as one flat float array, delimited "
+            "like edgesFlat().")
+
         // pickle support – serialise individuals as a plain Python list
         .def(py::pickle(
         [](const Population &p) { // __getstate__
@@ -1,9 +1,116 @@
+import copy
+import multiprocessing
 import pickle
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Per-process cache of gymnasium environments, keyed by environment name.
+# Each pool worker builds its own environment on first use; gym envs are
+# cheap to replicate but not safe to share across processes.
+_workerEnvs = {}
+
+
+def _evaluateNetworkGymnasium(args):
+    """
+    Pool worker: evaluate one pickled network in a worker-local environment.
+
+    Wraps the network into a single-individual scratch population so the
+    existing Population.gymnasium evaluation path is reused unchanged.
+    """
+    network, envName, dMax, maxSteps, maxConsecutiveP, worstFitness, seed = args
+    import gymnasium as gym
+    from ._core import Population
+
+    env = _workerEnvs.get(envName)
+    if env is None:
+        env = gym.make(envName)
+        _workerEnvs[envName] = env
+
+    pop = Population(
+        seed=0, ni=1, jn=2, jnf=1, pn=2, pnf=1,
+        fractalJudgment=False, nFeatureValues=[],
+    )
+    pop.individuals = [network]
+    pop.gymnasium(
+        env,
+        dMax=dMax,
+        maxSteps=maxSteps,
+        maxConsecutiveP=maxConsecutiveP,
+        worstFitness=worstFitness,
+        seed=seed,
+    )
+    return pop.individuals[0].fitness
+
+
+def gymnasiumParallel(pop, envName, dMax, maxSteps, maxConsecutiveP,
+                      worstFitness, seed, maxWorkers=None):
+    """
+    Evaluate all individuals in parallel across a process pool.
+
+    Fitness evaluation is embarrassingly parallel: each worker process owns
+    an independent gymnasium environment and receives pickled individuals,
+    so the episodes of different individuals run concurrently while the GA
+    operators stay in the main process. Semantics match pop.gymnasium():
+    every individual is evaluated on an episode reset with the same seed.
+
+    Parameters
+    ----------
+    pop : Population
+        The population whose individuals should be evaluated. The fitness
+        of each individual is written back in place.
+    envName : str
+        Name of the gymnasium environment, e.g. "CartPole-v1". Passed to
+        gym.make() once per worker process.
+    dMax : int
+        Maximum consecutive judgment nodes per decision.
+    maxSteps : int
+        Maximum episode length.
+    maxConsecutiveP : int
+        Maximum consecutive processing nodes allowed.
+    worstFitness : int
+        Fitness value assigned when networks violate constraints.
+    seed : int
+        Random seed for environment initialization.
+    maxWorkers : int, optional
+        Number of worker processes (default: number of CPUs).
+
+    Returns
+    -------
+    None
+        Fitness values are written back into pop.individuals.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")  # avoids re-import cost
+    else:
+        context = multiprocessing.get_context()
+
+    tasks = [
+        (network, envName, dMax, maxSteps, maxConsecutiveP, worstFitness, seed)
+        for network in pop.individuals
+    ]
+    with ProcessPoolExecutor(max_workers=maxWorkers, mp_context=context) as executor:
+        fitnessValues = list(executor.map(_evaluateNetworkGymnasium, tasks))
+
+    for network, fitness in zip(pop.individuals, fitnessValues):
+        network.fitness = fitness
+
+# File header marking the protocol-5 format with out-of-band buffers.
+# Files written by older versions start directly with the pickle stream,
+# so loadPopulation falls back to a plain pickle.load if the magic is absent.
+_MAGIC = b"FNPK5"
+
 
 def storePopulation(obj, filename):
     """
     Store a population object in a file using pickle serialization.
 
+    Uses pickle protocol 5 with out-of-band buffers: the node arrays
+    (edges, boundaries, production rule parameters) are written as raw
+    contiguous buffers after the pickle stream instead of being embedded
+    as many small Python objects, which keeps files small and loads fast.
+
     Parameters
     ----------
     obj : Population
@@ -16,8 +123,17 @@ def storePopulation(obj, filename):
     None
         Prints a confirmation message upon successful storage.
     """
+    buffers = []
+    payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
     with open(filename, 'wb') as f:
-        pickle.dump(obj, f)
+        f.write(_MAGIC)
+        f.write(struct.pack('<Q', len(payload)))
+        f.write(payload)
+        f.write(struct.pack('<Q', len(buffers)))
+        for buffer in buffers:
+            raw = buffer.raw()
+            f.write(struct.pack('<Q', raw.nbytes))
+            f.write(raw)
     print(f"Population successfully stored in '{filename}'.")
 
 
@@ -25,6 +141,10 @@ def loadPopulation(filename):
     """
     Load a previously stored population object from a file.
 
+    Reads the protocol-5 format written by storePopulation (pickle stream
+    followed by its out-of-band buffers). Files written by older versions
+    of storePopulation are detected and loaded with a plain pickle.load.
+
     Parameters
     ----------
     filename : str
@@ -36,5 +156,301 @@ def loadPopulation(filename):
         The deserialized population object.
     """
     with open(filename, 'rb') as f:
-        obj = pickle.load(f)
-    return obj
+        magic = f.read(len(_MAGIC))
+        if magic != _MAGIC:  # legacy file without out-of-band buffers
+            f.seek(0)
+            return pickle.load(f)
+        (payloadSize,) = struct.unpack('<Q', f.read(8))
+        payload = f.read(payloadSize)
+        (nBuffers,) = struct.unpack('<Q', f.read(8))
+        buffers = []
+        for _ in range(nBuffers):
+            (bufferSize,) = struct.unpack('<Q', f.read(8))
+            buffers.append(f.read(bufferSize))
+        return pickle.loads(payload, buffers=buffers)
+
+
+def storePopulationFast(pop, filename):
+    """
+    Store a population as stacked NumPy arrays instead of a pickle graph.
+
+    Walks all individuals and concatenates each node field (edges,
+    boundaries, production rule parameters, types, functions) into one
+    flat array per field, delimited by offset arrays. One np.savez call
+    then writes a few large buffers instead of pickling thousands of
+    small node objects, which is several times faster on large
+    populations and produces smaller files.
+
+    Parameters
+    ----------
+    pop : Population
+        The population object to store.
+    filename : str
+        Path or filename where the arrays should be saved (np.savez
+        appends '.npz' if missing).
+
+    Returns
+    -------
+    None
+        Prints a confirmation message upon successful storage.
+    """
+    nodeCounts = []
+    nodeTypes = []
+    nodeF = []
+    kd = []
+    edges = []
+    edgeOffsets = [0]
+    boundaries = []
+    boundaryOffsets = [0]
+    productionRuleParameter = []
+    prpOffsets = [0]
+    startEdges = []
+    fitness = []
+
+    for individual in pop.individuals:
+        innerNodes = individual.innerNodes
+        nodeCounts.append(len(innerNodes))
+        startEdges.append(individual.startNode.edges[0])
+        fitness.append(individual.fitness)
+        for node in innerNodes:
+            nodeTypes.append(0 if node.type == "J" else 1)
+            nodeF.append(node.f)
+            kd.append(node.k_d)
+            edges.extend(node.edges)
+            edgeOffsets.append(len(edges))
+            boundaries.extend(node.boundaries)
+            boundaryOffsets.append(len(boundaries))
+            productionRuleParameter.extend(node.productionRuleParameter)
+            prpOffsets.append(len(productionRuleParameter))
+
+    np.savez(
+        filename,
+        meta=np.asarray(
+            [pop.ni, pop.jn, pop.jnf, pop.pn, pop.pnf, int(pop.fractalJudgment)],
+            dtype=np.int64,
+        ),
+        nFeatureValues=np.asarray(pop.nFeatureValues, dtype=np.int32),
+        nodeCounts=np.asarray(nodeCounts, dtype=np.int64),
+        nodeTypes=np.asarray(nodeTypes, dtype=np.uint8),
+        nodeF=np.asarray(nodeF, dtype=np.int32),
+        kd=np.asarray(kd, dtype=np.int32).reshape(-1, 2),
+        edges=np.asarray(edges, dtype=np.int32),
+        edgeOffsets=np.asarray(edgeOffsets, dtype=np.int64),
+        boundaries=np.asarray(boundaries, dtype=np.float32),
+        boundaryOffsets=np.asarray(boundaryOffsets, dtype=np.int64),
+        productionRuleParameter=np.asarray(productionRuleParameter, dtype=np.float32),
+        prpOffsets=np.asarray(prpOffsets, dtype=np.int64),
+        startEdges=np.asarray(startEdges, dtype=np.int32),
+        fitness=np.asarray(fitness, dtype=np.float32),
+    )
+    print(f"Population successfully stored in '{filename}'.")
+
+
+def loadPopulationFast(filename):
+    """
+    Load a population stored with storePopulationFast.
+
+    Reconstructs the Population from the stacked field arrays. The
+    members of the .npz archive are loaded lazily by np.load, so only
+    the arrays that are actually touched are read from disk.
+
+    Parameters
+    ----------
+    filename : str
+        Path or filename of the stored population (including '.npz').
+
+    Returns
+    -------
+    Population
+        The reconstructed population object.
+    """
+    from ._core import Population
+
+    data = np.load(filename)
+    ni, jn, jnf, pn, pnf, fractalJudgment = (int(v) for v in data["meta"])
+    pop = Population(
+        seed=0,
+        ni=ni,
+        jn=jn,
+        jnf=jnf,
+        pn=pn,
+        pnf=pnf,
+        fractalJudgment=bool(fractalJudgment),
+        nFeatureValues=[int(v) for v in data["nFeatureValues"]],
+    )
+
+    nodeCounts = data["nodeCounts"]
+    nodeTypes = data["nodeTypes"]
+    nodeF = data["nodeF"]
+    kd = data["kd"]
+    edges = data["edges"]
+    edgeOffsets = data["edgeOffsets"]
+    boundaries = data["boundaries"]
+    boundaryOffsets = data["boundaryOffsets"]
+    productionRuleParameter = data["productionRuleParameter"]
+    prpOffsets = data["prpOffsets"]
+    startEdges = data["startEdges"]
+    fitness = data["fitness"]
+
+    template = pop.individuals[0].innerNodes[0]
+    n = 0  # global node index into the flat arrays
+    for i in range(ni):
+        innerNodes = []
+        for j in range(int(nodeCounts[i])):
+            node = copy.copy(template)
+            node.id = j
+            node.type = "J" if nodeTypes[n] == 0 else "P"
+            node.f = int(nodeF[n])
+            node.k_d = (int(kd[n, 0]), int(kd[n, 1]))
+            node.edges = edges[edgeOffsets[n]:edgeOffsets[n + 1]].tolist()
+            node.boundaries = boundaries[boundaryOffsets[n]:boundaryOffsets[n + 1]].tolist()
+            node.productionRuleParameter = productionRuleParameter[prpOffsets[n]:prpOffsets[n + 1]].tolist()
+            innerNodes.append(node)
+            n += 1
+        individual = pop.individuals[i]
+        individual.innerNodes = innerNodes
+        individual.startNode.edges = [int(startEdges[i])]
+        individual.fitness = float(fitness[i])
+    return pop
+
+
+# Field suffixes written by storeNetworkArrays; one .npy file per field so
+# loadNetworkArrays can hand each one to np.load(..., mmap_mode='r').
+_NETWORK_ARRAY_FIELDS = (
+    "meta", "nFeatureValues", "nodeTypes", "nodeF", "kd",
+    "edges", "edgeOffsets", "boundaries", "boundaryOffsets",
+    "productionRuleParameter", "prpOffsets", "startEdge",
+)
+
+
+def storeNetworkArrays(network, pop, filename):
+    """
+    Store a single network's node fields as flat .npy files.
+
+    Intended for snapshotting the best individual after training: each
+    field (edges, boundaries, ...) is written as one contiguous array to
+    its own '<filename>.<field>.npy' file. Unlike a pickle graph, these
+    files can be re-opened with np.load(..., mmap_mode='r'), so repeated
+    validation runs read the snapshot through the page cache instead of
+    rebuilding thousands of small Python objects per load.
+
+    Parameters
+    ----------
+    network : Network
+        The network (individual) to store.
+    pop : Population
+        The population the network belongs to (provides the construction
+        parameters jn, jnf, pn, pnf, fractalJudgment, nFeatureValues
+        needed to rebuild the network).
+    filename : str
+        Path prefix for the .npy files.
+
+    Returns
+    -------
+    None
+        Prints a confirmation message upon successful storage.
+    """
+    nodeTypes = []
+    nodeF = []
+    kd = []
+    edges = []
+    edgeOffsets = [0]
+    boundaries = []
+    boundaryOffsets = [0]
+    productionRuleParameter = []
+    prpOffsets = [0]
+
+    for node in network.innerNodes:
+        nodeTypes.append(0 if node.type == "J" else 1)
+        nodeF.append(node.f)
+        kd.append(node.k_d)
+        edges.extend(node.edges)
+        edgeOffsets.append(len(edges))
+        boundaries.extend(node.boundaries)
+        boundaryOffsets.append(len(boundaries))
+        productionRuleParameter.extend(node.productionRuleParameter)
+        prpOffsets.append(len(productionRuleParameter))
+
+    arrays = {
+        "meta": np.asarray(
+            [pop.jn, pop.jnf, pop.pn, pop.pnf, int(pop.fractalJudgment)],
+            dtype=np.int64,
+        ),
+        "nFeatureValues": np.asarray(pop.nFeatureValues, dtype=np.int32),
+        "nodeTypes": np.asarray(nodeTypes, dtype=np.uint8),
+        "nodeF": np.asarray(nodeF, dtype=np.int32),
+        "kd": np.asarray(kd, dtype=np.int32).reshape(-1, 2),
+        "edges": np.asarray(edges, dtype=np.int32),
+        "edgeOffsets": np.asarray(edgeOffsets, dtype=np.int64),
+        "boundaries": np.asarray(boundaries, dtype=np.float32),
+        "boundaryOffsets": np.asarray(boundaryOffsets, dtype=np.int64),
+        "productionRuleParameter": np.asarray(productionRuleParameter, dtype=np.float32),
+        "prpOffsets": np.asarray(prpOffsets, dtype=np.int64),
+        "startEdge": np.asarray([network.startNode.edges[0]], dtype=np.int32),
+    }
+    for field, array in arrays.items():
+        np.save(f"{filename}.{field}.npy", array)
+    print(f"Network successfully stored in '{filename}.*.npy'.")
+
+
+def loadNetworkArrays(filename):
+    """
+    Load a network stored with storeNetworkArrays.
+
+    The field files are opened with np.load(..., mmap_mode='r'), so the
+    array data is memory-mapped and repeated loads of the same snapshot
+    share the page cache instead of re-reading from disk. The Network is
+    rebuilt inside a single-individual scratch population (the same
+    pattern as the parallel gymnasium workers), so it can be evaluated
+    or inserted into another population directly.
+
+    Parameters
+    ----------
+    filename : str
+        Path prefix used in storeNetworkArrays.
+
+    Returns
+    -------
+    Network
+        The reconstructed network.
+    """
+    from ._core import Population
+
+    data = {
+        field: np.load(f"{filename}.{field}.npy", mmap_mode="r")
+        for field in _NETWORK_ARRAY_FIELDS
+    }
+    jn, jnf, pn, pnf, fractalJudgment = (int(v) for v in data["meta"])
+    pop = Population(
+        seed=0,
+        ni=1,
+        jn=jn,
+        jnf=jnf,
+        pn=pn,
+        pnf=pnf,
+        fractalJudgment=bool(fractalJudgment),
+        nFeatureValues=[int(v) for v in data["nFeatureValues"]],
+    )
+
+    edgeOffsets = data["edgeOffsets"]
+    boundaryOffsets = data["boundaryOffsets"]
+    prpOffsets = data["prpOffsets"]
+    template = pop.individuals[0].innerNodes[0]
+    innerNodes = []
+    for n in range(len(data["nodeTypes"])):
+        node = copy.copy(template)
+        node.id = n
+        node.type = "J" if data["nodeTypes"][n] == 0 else "P"
+        node.f = int(data["nodeF"][n])
+        node.k_d = (int(data["kd"][n, 0]), int(data["kd"][n, 1]))
+        node.edges = data["edges"][edgeOffsets[n]:edgeOffsets[n + 1]].tolist()
+        node.boundaries = data["boundaries"][boundaryOffsets[n]:boundaryOffsets[n + 1]].tolist()
+        node.productionRuleParameter = data["productionRuleParameter"][prpOffsets[n]:prpOffsets[n + 1]].tolist()
+        innerNodes.append(node)
+
+    # copy.copy detaches the network from the scratch population (via its
+    # pickle support), so the returned object outlives pop
+    network = copy.copy(pop.individuals[0])
+    network.innerNodes = innerNodes
+    network.startNode.edges = [int(data["startEdge"][0])]
+    return network
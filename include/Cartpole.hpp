@@ -1,5 +1,6 @@
 #include <cmath>
 #include <random>
+#include "Random.hpp"
 #include <iostream>
 #include <array>
 
@@ -42,7 +43,7 @@ public:
     const double x_threshold = 2.4;
 
     // Random number generator for state initialization
-    std::shared_ptr<std::mt19937_64> rng;
+    std::shared_ptr<RandomEngine> rng;
     std::uniform_real_distribution<double> dist{-0.05, 0.05};
 
     /**
@@ -53,7 +54,7 @@ public:
      */
     int steps_beyond_terminated = -1;
 
-    CartPole(std::shared_ptr<std::mt19937_64> _rng): 
+    CartPole(std::shared_ptr<RandomEngine> _rng): 
         rng(_rng)
     {
         state = {0.0, 0.0, 0.0, 0.0};
@@ -3,6 +3,7 @@
 #include <vector>
 #include <iostream>
 #include <random>
+#include "Random.hpp"
 
 /**
  * @file Fractal.hpp
@@ -59,7 +60,7 @@
  * 
  * @note Multiple calls with same N can return different (k, d) combinations
  */
-inline std::pair<int,int> random_k_d_combination(int N, std::shared_ptr<std::mt19937_64> generator){
+inline std::pair<int,int> random_k_d_combination(int N, std::shared_ptr<RandomEngine> generator){
     int k=2;
     int start;
     if(N <= 3){start = 1;}else{start = 2;}
@@ -106,7 +107,7 @@ inline std::pair<int,int> random_k_d_combination(int N, std::shared_ptr<std::mt1
  * @note Uses std::nextafter(0.0f, 1.0f) to exclude exact 0 and 1 from the random distribution
  * @see sortAndDistance() and fractalLengths() for converting random cuts to fractal interval lengths
  */
-inline std::vector<float> randomParameterCuts(int N, std::shared_ptr<std::mt19937_64> generator){
+inline std::vector<float> randomParameterCuts(int N, std::shared_ptr<RandomEngine> generator){
     std::vector<float> productionRuleParameter {0};
     for(int i=0; i<N; i++){
         std::uniform_real_distribution<float> distributionUniform(std::nextafter(0.0f, 1.0f), 1);
@@ -47,7 +47,7 @@
  */
 class Network {
     private:
-        std::shared_ptr<std::mt19937_64> generator; ///< Shared pointer to random number generator for stochastic operations
+        std::shared_ptr<RandomEngine> generator; ///< Shared pointer to random number generator for stochastic operations
 
     public:
         /** @cond INTERNAL */
@@ -89,7 +89,7 @@ class Network {
          * For judgment nodes with fractal patterns enabled, the constructor calculates
          * the number of outgoing edges according to random_k_d_combination().
          * 
-         * @param _generator Shared pointer to a Mersenne Twister random number generator (std::mt19937_64) used for all stochastic operations
+         * @param _generator Shared pointer to a xoshiro256++ random number generator (RandomEngine) used for all stochastic operations
          * @param _jn Number of initial judgment nodes in the network
          * @param _jnf Number of judgment node function types available (determines random function assignment range)
          * @param _pn Number of initial processing nodes in the network
@@ -101,7 +101,7 @@ class Network {
          *          - default is an empty vector and all features are treated as numerical
          */
         Network(
-                std::shared_ptr<std::mt19937_64> _generator,
+                std::shared_ptr<RandomEngine> _generator,
                 unsigned int _jn,
                 unsigned int _jnf,
                 unsigned int _pn,
@@ -159,6 +159,27 @@ class Network {
 
         /** @name Member Functions */
         /** @{ */
+        /**
+         * @brief Rebinds the network and all its nodes to another random number generator.
+         *
+         * @details
+         * Every network owns a private engine so that stochastic operations of
+         * different individuals are independent (see the Population constructor).
+         * Selection copies networks and crossover moves nodes between networks,
+         * which leaves copies sharing one engine; Population::tournamentSelection()
+         * calls this method with a fresh engine for every individual after
+         * selection to restore per-network independence.
+         *
+         * @param _generator Shared pointer to the new random number generator
+         */
+        void setGenerator(std::shared_ptr<RandomEngine> _generator){
+            generator = _generator;
+            startNode.setGenerator(generator);
+            for(auto& node : innerNodes){
+                node.setGenerator(generator);
+            }
+        }
+
         /**
          * @brief Resets the usage status of all nodes in the network.
          * 
@@ -272,38 +293,45 @@ class Network {
         int decisionAndNextNode(const dataContainer& data, int dMax){
             int dec;
             int dSum = 0;
-            double v;
-            if(innerNodes[currentNodeID].type == "P"){
-                dec = innerNodes[currentNodeID].f;
+            // hot loop: node types are single-character strings ("S"/"P"/"J"),
+            // so comparing the first char skips a std::string comparison per
+            // visited node, and the cached node pointer avoids re-indexing
+            // innerNodes for every member access
+            Node* node = &innerNodes[currentNodeID];
+            if(node->type[0] == 'P'){
+                dec = node->f;
                 // update currentNodeID to next node
-                currentNodeID = innerNodes[currentNodeID].edges[0]; 
-                innerNodes[currentNodeID].used = true;
+                currentNodeID = node->edges[0];
+                Node& next = innerNodes[currentNodeID];
+                next.used = true;
                 traverseCounter ++;
-                innerNodes[currentNodeID].traverseCounter = traverseCounter;
+                next.traverseCounter = traverseCounter;
                 nConsecutiveP ++;
 
-            } else if (innerNodes[currentNodeID].type == "J"){
+            } else if (node->type[0] == 'J'){
                 nConsecutiveP = 0;
-                while(innerNodes[currentNodeID].type == "J"){
+                while(node->type[0] == 'J'){
                     // update currentNodeID to next node
-                    v = data[innerNodes[currentNodeID].f];
-                    int judgeResult = innerNodes[currentNodeID].judge(v);
-                    currentNodeID = innerNodes[currentNodeID].edges[judgeResult];
-                    innerNodes[currentNodeID].used = true;
+                    const float v = data[node->f];
+                    int judgeResult = node->judge(v);
+                    currentNodeID = node->edges[judgeResult];
+                    node = &innerNodes[currentNodeID];
+                    node->used = true;
                     traverseCounter ++;
-                    innerNodes[currentNodeID].traverseCounter = traverseCounter;
+                    node->traverseCounter = traverseCounter;
                     dSum ++;
                     if (dSum >= dMax){
                         invalid = true;
-                        return std::numeric_limits<int>::lowest(); 
+                        return std::numeric_limits<int>::lowest();
                     }
                 }
-                dec = innerNodes[currentNodeID].f;
+                dec = node->f;
                 // update currentNodeID to next node
-                currentNodeID = innerNodes[currentNodeID].edges[0]; 
-                innerNodes[currentNodeID].used = true;
+                currentNodeID = node->edges[0];
+                Node& next = innerNodes[currentNodeID];
+                next.used = true;
                 traverseCounter ++;
-                innerNodes[currentNodeID].traverseCounter = traverseCounter;
+                next.traverseCounter = traverseCounter;
                 nConsecutiveP ++;
            }
             return dec;
@@ -542,9 +570,12 @@ class Network {
          * @param dMax Maximum consecutive judgment nodes per decision (prevents infinite loops in graph traversal)
          * @param penalty Divisor applied to fitness when network violates structural constraints
          * @param maxSteps Maximum episode length (prevents indefinite episodes and caps maximum fitness)
-         * @param maxConsecutiveP Maximum consecutive processing nodes allowed 
-         *  Here we can control the number of possible actions after using the observation data again.  
-         * 
+         * @param maxConsecutiveP Maximum consecutive processing nodes allowed
+         *  Here we can control the number of possible actions after using the observation data again.
+         *
+         * @note The CartPole environment draws from the network's own engine, so individuals
+         *  can be evaluated concurrently (see Population::cartpole()).
+         *
          */
         void fitCartpole(
             int dMax,
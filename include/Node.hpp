@@ -27,7 +27,7 @@
  */
 class Node {
     private:
-        std::shared_ptr<std::mt19937_64> generator; /**< Shared pointer to random number generator for stochastic operations */
+        std::shared_ptr<RandomEngine> generator; /**< Shared pointer to random number generator for stochastic operations */
     
     public:
         /** @cond INTERNAL */
@@ -35,7 +35,7 @@ class Node {
         std::string type; /**< Node type: "S" (Start), "P" (Processing), or "J" (Judgment) */
         unsigned int f; /**< Node function: feature index for judgment nodes or output value for processing nodes */
         std::vector<int> edges; /**< Indices of successor nodes (outgoing edges) */
-        std::vector<double> boundaries; /**< Decision boundaries for judgment nodes (divides feature space into intervals) */
+        std::vector<float> boundaries; /**< Decision boundaries for judgment nodes (divides feature space into intervals); float32 halves the memory traffic of judge() and the boundary mutations */
         std::vector<float> productionRuleParameter = {}; /**< Parameters for fractal-based edge generation (used when fractalJudgment is enabled) */
         std::pair<int, int> k_d; /**< Fractal parameters: k (base) and d (depth) for fractal edge structure */
         bool used = false; /**< Flag indicating whether this node was visited during network traversal */
@@ -52,7 +52,7 @@ class Node {
          * The node is initialized without edges or boundaries, which must be set separately
          * using setEdges() and setEdgesBoundaries() methods.
          * 
-         * @param _generator Shared pointer to a Mersenne Twister random number generator (std::mt19937_64) for stochastic operations
+         * @param _generator Shared pointer to a xoshiro256++ random number generator (RandomEngine) for stochastic operations
          * @param _id Unique identifier for this node within the network. The id should be always the index of "innerNodes" in a Network.
          * @param _type Node type as string: 
          *  - "S" for Start Node, 
@@ -61,7 +61,7 @@ class Node {
          * @param _f Node function: for judgment nodes this is the feature index to evaluate; for processing nodes this is the output/action value
          */
         Node(
-            std::shared_ptr<std::mt19937_64> _generator,
+            std::shared_ptr<RandomEngine> _generator,
             unsigned int _id, 
             std::string _type,
             unsigned int _f
@@ -76,6 +76,20 @@ class Node {
 
         /** @name Member Functions */
         /** @{ */
+        /**
+         * @brief Rebinds the node to another random number generator.
+         *
+         * @details
+         * Used by Network::setGenerator() to keep all nodes of a network on the
+         * network's own engine, e.g. after selection copied a network or after
+         * crossover moved a node between networks.
+         *
+         * @param _generator Shared pointer to the new random number generator
+         */
+        void setGenerator(std::shared_ptr<RandomEngine> _generator){
+            generator = _generator;
+        }
+
         /**
          * @brief Initializes the outgoing edges of the node based on its type and network size.
          *
@@ -218,17 +232,19 @@ class Node {
          * @note If lengths is provided, it should have size edges.size() with values summing to 1.0
          * @note Uniform spacing is used when lengths is empty or has size 0
          */
-        void setEdgesBoundaries(float minf, float maxf, std::vector<float> lengths = {}){ 
+        void setEdgesBoundaries(float minf, float maxf, const std::vector<float>& lengths = {}){
            float sum = minf;
-           float span;
+           boundaries.reserve(boundaries.size() + edges.size() + 1);
+           const float uniformSpan = (maxf - minf) / edges.size(); // hoisted: constant across the loop
            for(int i = 0; i<edges.size()+1; i++){
-               if(lengths.size()==0){
-                   span = (maxf - minf) / edges.size();
-               }else {
-                   span = (maxf - minf) * lengths[i];
-               } 
                boundaries.push_back(sum);
-               sum += span;
+               if(i < edges.size()){ // no span after the last boundary (lengths has edges.size() entries)
+                   if(lengths.size()==0){
+                       sum += uniformSpan;
+                   }else {
+                       sum += (maxf - minf) * lengths[i];
+                   }
+               }
            }
         }
 
@@ -6,6 +6,7 @@
 #include <vector>
 #include <random>
 #include <unordered_set>
+#include <thread>
 #include <utility>
 #include <cmath>
 #include "Network.hpp"
@@ -38,7 +39,7 @@
  */
 class Population {
     private:
-        std::shared_ptr<std::mt19937_64> generator; /**< Shared pointer to random number generator for all stochastic operations */
+        std::shared_ptr<RandomEngine> generator; /**< Shared pointer to random number generator for all stochastic operations */
         /** @cond INTERNAL */
         struct additionalMutationParam {
             int networkSize = -1;
@@ -76,8 +77,10 @@ class Population {
          *    - Random initial topology and function assignments
          *    - Optional fractal edge patterns (if fractalJudgment is true)
          * 
-         * All individuals share the same random generator (via shared_ptr) to ensure
-         * reproducibility and coordinated randomness across the population.
+         * Every individual owns a private random generator seeded from the master
+         * generator, so stochastic operations of different individuals are independent
+         * (e.g. for parallel fitness evaluation) while the whole run remains
+         * reproducible from the population seed.
          * 
          * @param seed Random seed for the generator
          * @param _ni Number of individuals to create in the population
@@ -102,7 +105,7 @@ class Population {
                 bool _fractalJudgment,
                 std::vector<int> _nFeatureValues = {}
                 ):
-            generator(std::make_shared<std::mt19937_64>(seed)),
+            generator(std::make_shared<RandomEngine>(seed)),
             ni(_ni),
             jn(_jn),
             jnf(_jnf),
@@ -113,7 +116,12 @@ class Population {
 
     {
         for(int i=0; i<ni; i++){
-            individuals.push_back(Network(generator,jn,jnf,pn,pnf,fractalJudgment,nFeatureValues));
+            // every network gets a private engine seeded from the master
+            // generator, so the stochastic operations of different
+            // individuals are independent (and parallel evaluation never
+            // contends on a shared engine) while the whole run stays
+            // reproducible from the population seed
+            individuals.push_back(Network(std::make_shared<RandomEngine>((*generator)()),jn,jnf,pn,pnf,fractalJudgment,nFeatureValues));
         }
     }
         /** @} */
@@ -299,17 +307,21 @@ class Population {
 
         /**
          * @brief Evaluates all individuals on the CartPole balancing control problem.
-         * 
+         *
          * @details
-         * This method applies fitCartpole() to the entire population 
+         * This method applies fitCartpole() to the entire population. The episodes are
+         * independent of each other, so the individuals are evaluated in parallel across
+         * hardware threads. Every network owns a private random engine (see the
+         * constructor), so the threads never contend on a shared engine and the results
+         * are reproducible regardless of thread scheduling.
          *
          * @see Network::fitCartpole()
-         * 
+         *
          * @param dMax Maximum consecutive judgment nodes per decision (prevents infinite loops)
          * @param penalty Divisor applied to fitness when constraints are violated
-         * @param maxSteps Maximum episode length 
-         * @param maxConsecutiveP Maximum consecutive processing nodes allowed 
-         * 
+         * @param maxSteps Maximum episode length
+         * @param maxConsecutiveP Maximum consecutive processing nodes allowed
+         *
          */
         void cartpole(
                 int dMax,
@@ -317,9 +329,19 @@ class Population {
                 int maxSteps,
                 int maxConsecutiveP
                 ){
-            applyFitness([=](Network& network){
-                    network.fitCartpole(dMax,penalty,maxSteps,maxConsecutiveP);
-            });
+            unsigned int nThreads = std::min<size_t>(
+                    std::max(1u, std::thread::hardware_concurrency()),
+                    individuals.size());
+            std::vector<std::thread> threads;
+            threads.reserve(nThreads);
+            for(unsigned int t=0; t<nThreads; t++){
+                threads.emplace_back([&, t](){
+                    for(size_t i=t; i<individuals.size(); i+=nThreads){
+                        individuals[i].fitCartpole(dMax, penalty, maxSteps, maxConsecutiveP);
+                    }
+                });
+            }
+            for(auto& thread : threads){ thread.join(); }
         }
 
         /**
@@ -356,35 +378,41 @@ class Population {
          * 
          */
         void tournamentSelection(int N, int E){
-            std::vector<Network> selection;
-            selection.reserve(individuals.size()); 
-            std::unordered_set<int> tournament;
-            tournament.reserve(N);
             std::uniform_int_distribution<int> distribution(0, individuals.size()-1);
             meanFitness = 0;
             minFitness = individuals[0].fitness;
             bestFit = individuals[0].fitness;
             maxNetworkSize = individuals[0].innerNodes.size();
 
+            // pass 1: determine all tournament winners as indices. The
+            // tournament itself lives in a small reused buffer with rejection
+            // sampling for distinctness — for typical N this avoids the
+            // hashing and per-round allocations of an unordered_set.
+            std::vector<int> winners(individuals.size()-E);
+            std::vector<int> tournament(N);
             for(int i=0; i<individuals.size()-E; i++){
                 if(individuals[i].innerNodes.size() > maxNetworkSize){
                     maxNetworkSize = individuals[i].innerNodes.size();
                 }
-                float bestFitTournament = std::numeric_limits<float>::lowest();
-                int indexBestIndTournament = 0;
-                tournament.clear();
-
-                while(tournament.size()<N){ // set the tournament
+                int filled = 0;
+                while(filled < N){ // set the tournament
                     int randomInt = distribution(*generator);
-                    tournament.insert(randomInt);
+                    bool duplicate = false;
+                    for(int j=0; j<filled; j++){
+                        if(tournament[j] == randomInt){duplicate = true; break;}
+                    }
+                    if(!duplicate){tournament[filled++] = randomInt;}
                 }
-                for(int k : tournament){
+                float bestFitTournament = std::numeric_limits<float>::lowest();
+                int indexBestIndTournament = 0;
+                for(int j=0; j<N; j++){
+                   int k = tournament[j];
                    if(individuals[k].fitness > bestFitTournament){
                        bestFitTournament = individuals[k].fitness;
                        indexBestIndTournament = k;
-                   } 
+                   }
                 }
-                selection.push_back(individuals[indexBestIndTournament]);
+                winners[i] = indexBestIndTournament;
                 meanFitness += bestFitTournament;
                 if (bestFitTournament < minFitness) {
                     minFitness = bestFitTournament;
@@ -393,9 +421,23 @@ class Population {
                     bestFit = bestFitTournament;
                 }
             }
+
+            // pass 2: materialize the new population from the winner indices
+            std::vector<Network> selection;
+            selection.reserve(individuals.size());
+            for(int w : winners){
+                selection.push_back(individuals[w]);
+            }
             setElite(E, individuals, selection);
             individuals = std::move(selection);
             meanFitness /= individuals.size();
+
+            // selection copies networks, so duplicated winners would share
+            // one engine and mutate in lockstep; give every individual a
+            // fresh engine drawn from the master generator
+            for(auto& network : individuals){
+                network.setGenerator(std::make_shared<RandomEngine>((*generator)()));
+            }
         }
         /**
          * @brief Identifies and preserves the elite individuals in the selection.
@@ -470,6 +512,7 @@ class Population {
          * 
          */
         void callEdgeMutation(float probInnerNodes, float probStartNode, bool justUsedNodes = false, int k = 0){
+            std::unordered_set<int> elite(indicesElite.begin(), indicesElite.end());
             for(int i=0; i<individuals.size(); i++){
 
                 int N;
@@ -480,7 +523,7 @@ class Population {
                     N = 0;
                 }
 
-                if(std::find(indicesElite.begin(), indicesElite.end(), i) == indicesElite.end()){// preventing elite
+                if(elite.count(i) == 0){// preventing elite
                     for(auto& node : individuals[i].innerNodes){
                         if(justUsedNodes == true && node.used == false){
                             continue;
@@ -520,8 +563,9 @@ class Population {
          */
         template <typename FuncMutation>
         void applyBoundaryMutation(FuncMutation&& func, bool justUsedNodes = false) {
+            std::unordered_set<int> elite(indicesElite.begin(), indicesElite.end());
             for (int i = 0; i < individuals.size(); ++i) {
-                if (std::find(indicesElite.begin(), indicesElite.end(), i) == indicesElite.end()) {
+                if (elite.count(i) == 0) {
                     additionalMutationParam amp;
                     amp.networkSize = individuals[i].innerNodes.size();
                     for (auto& node : individuals[i].innerNodes) {
@@ -733,12 +777,13 @@ class Population {
                 inds.push_back(i);
             }
             std::shuffle(inds.begin(), inds.end(), *generator);
-            for(int i=0; i<inds.size()-1; i+=2){ // for each individual pair 
-                
+            std::unordered_set<int> elite(indicesElite.begin(), indicesElite.end());
+            for(int i=0; i<inds.size()-1; i+=2){ // for each individual pair
+
                 std::vector<int> nodesToExchange;
 
-                bool parent1IsElite = std::find(indicesElite.begin(), indicesElite.end(), inds[i]) != indicesElite.end();
-                bool parent2IsElite = std::find(indicesElite.begin(), indicesElite.end(), inds[i+1]) != indicesElite.end();
+                bool parent1IsElite = elite.count(inds[i]) != 0;
+                bool parent2IsElite = elite.count(inds[i+1]) != 0;
 
                 // Both elite → skip entirely (no crossover between two elites)
                 if(parent1IsElite && parent2IsElite){
@@ -1166,14 +1211,66 @@ class Population {
          */
         void callAddDelNodes(std::vector<float>& minF, std::vector<float>& maxF, float junk=0, bool noElite = false){
 
+            std::unordered_set<int> elite(indicesElite.begin(), indicesElite.end());
             for(int i=0; i<individuals.size(); i++){
 
-                if (std::find(indicesElite.begin(), indicesElite.end(), i) == indicesElite.end()) {continue;} // skip elite individuals if noElite is true
+                if (noElite && elite.count(i) != 0) {continue;} // skip elite individuals if noElite is true
                 individuals[i].addDelNodes(minF, maxF, junk, nFeatureValues);
 
             }
         }
 
+        /**
+         * @brief Runs one full generation of evolutionary operators in a single call.
+         *
+         * @details
+         * Applies the standard operator sequence of the generation loop:
+         *
+         * 1. tournamentSelection() - selects survivors and the elite
+         * 2. crossover() - recombines network structures
+         * 3. callAddDelNodes() - grows/shrinks network topologies
+         * 4. callEdgeMutation() - mutates edge connections
+         *
+         * Fusing the sequence into one native call keeps the whole operator
+         * phase of a generation inside C++: the Python loop crosses the
+         * binding boundary once instead of four times and the binding can
+         * release the GIL for the entire phase. The operators themselves are
+         * unchanged — calling evolve() is equivalent to calling the four
+         * methods in the order above.
+         *
+         * @param N Number of tournament participants (see tournamentSelection())
+         * @param E Number of elite individuals to preserve
+         * @param crossoverProbability Probability of crossover per node or individual (see crossover())
+         * @param crossoverType Crossover type: "uniform", "onepoint" or "randomWidth"
+         * @param minF Vector of minimum values for all features (for new judgment node initialization)
+         * @param maxF Vector of maximum values for all features (for new judgment node initialization)
+         * @param junk Ratio of protected unused nodes (see callAddDelNodes())
+         * @param probInnerNodes Mutation probability per inner node edge (see callEdgeMutation())
+         * @param probStartNode Mutation probability for the start node edge
+         * @param justUsedNodes If true, only mutates edges of used (traversed) nodes
+         * @param k Number of edges for newly added judgment nodes (0 = random)
+         *
+         * @see tournamentSelection(), crossover(), callAddDelNodes(), callEdgeMutation()
+         */
+        void evolve(
+                int N,
+                int E,
+                float crossoverProbability,
+                std::string crossoverType,
+                std::vector<float>& minF,
+                std::vector<float>& maxF,
+                float junk = 0,
+                float probInnerNodes = 0,
+                float probStartNode = 0,
+                bool justUsedNodes = false,
+                int k = 0
+                ){
+            tournamentSelection(N, E);
+            crossover(crossoverProbability, crossoverType);
+            callAddDelNodes(minF, maxF, junk);
+            callEdgeMutation(probInnerNodes, probStartNode, justUsedNodes, k);
+        }
+
         /**
          * @brief Evaluates all individuals across multiple seeds and stores per-seed rewards.
          * 
@@ -1355,6 +1452,12 @@ class Population {
             setEliteDual(E_reward, E_landing, individuals, selection);
             individuals = std::move(selection);
             meanFitness /= individuals.size();
+
+            // as in tournamentSelection(): duplicated winners share an engine
+            // after the copy, so every individual is rebound to a fresh one
+            for(auto& network : individuals){
+                network.setGenerator(std::make_shared<RandomEngine>((*generator)()));
+            }
         }
 
         /**
@@ -0,0 +1,76 @@
+#ifndef RANDOM_HPP
+#define RANDOM_HPP
+#include <cstdint>
+
+/**
+ * @file Random.hpp
+ * @brief Fast random number engine used by all stochastic operations.
+ *
+ * @details
+ * Mutation, crossover and selection draw one random number per element, so
+ * the engine sits on the hot path of every evolutionary operator. This file
+ * provides xoshiro256++ (Blackman & Vigna, https://prng.di.unimi.it), a
+ * small-state generator that produces a 64-bit value in a handful of
+ * cycles — several times faster than std::mt19937_64 with its 2.5 KiB
+ * state — while passing the common statistical test batteries.
+ *
+ * The engine satisfies the UniformRandomBitGenerator requirements, so it is
+ * a drop-in replacement for std::mt19937_64 in the standard distributions
+ * and std::shuffle. All classes use it through the RandomEngine alias.
+ */
+
+/**
+ * @brief xoshiro256++ random number engine.
+ *
+ * @details
+ * Keeps 256 bits of state, advanced with shifts, xors and rotations only.
+ * Seeding expands a single 64-bit seed through splitmix64 as recommended by
+ * the xoshiro authors, so nearby seeds still produce decorrelated streams.
+ */
+class Xoshiro256PlusPlus {
+    private:
+        uint64_t s[4]; /**< 256-bit generator state */
+
+        static inline uint64_t rotl(const uint64_t x, int k){
+            return (x << k) | (x >> (64 - k));
+        }
+
+    public:
+        using result_type = uint64_t;
+        static constexpr result_type min(){ return 0; }
+        static constexpr result_type max(){ return UINT64_MAX; }
+
+        /**
+         * @brief Constructs the engine from a single 64-bit seed.
+         * @param seed Seed value; expanded into the full state via splitmix64
+         */
+        explicit Xoshiro256PlusPlus(uint64_t seed = 0){
+            for(auto& state : s){ // splitmix64 state expansion
+                seed += 0x9e3779b97f4a7c15ULL;
+                uint64_t z = seed;
+                z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+                z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+                state = z ^ (z >> 31);
+            }
+        }
+
+        /**
+         * @brief Advances the state and returns the next 64-bit value.
+         */
+        result_type operator()(){
+            const uint64_t result = rotl(s[0] + s[3], 23) + s[0];
+            const uint64_t t = s[1] << 17;
+            s[2] ^= s[0];
+            s[3] ^= s[1];
+            s[1] ^= s[2];
+            s[0] ^= s[3];
+            s[2] ^= t;
+            s[3] = rotl(s[3], 45);
+            return result;
+        }
+};
+
+/** Engine type shared by Population, Network, Node and CartPole. */
+using RandomEngine = Xoshiro256PlusPlus;
+
+#endif
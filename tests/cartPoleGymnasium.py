@@ -1,6 +1,6 @@
 import fracnetics as fn
 import gymnasium as gym
-import statistics
+import numpy as np
 import time
 
 start = time.perf_counter()
@@ -18,11 +18,15 @@ pop = fn.Population(
     nFeatureValues=[0, 0, 0, 0],
 )
 
-minFeatures = [-4.8, -5, -0.418, -10]
-maxFeatures = [4.8, 5, 0.418, 10]
+# converted once up front: the bindings read float32 ndarrays zero-copy,
+# so the per-generation calls below skip the list->vector marshal
+minFeatures = np.asarray([-4.8, -5, -0.418, -10], dtype=np.float32)
+maxFeatures = np.asarray([4.8, 5, 0.418, 10], dtype=np.float32)
 pop.setAllNodeBoundaries(minFeatures, maxFeatures)
 
-fitnessProgess = []
+# preallocated: the per-generation best fitness goes straight into a float32
+# array, so the mean at the end is one C-level reduction
+fitnessProgress = np.empty(10, dtype=np.float32)
 for g in range(10):
     pop.gymnasium(
         env,
@@ -32,13 +36,24 @@ for g in range(10):
         worstFitness=0,
         seed=seed + g,
     )
-    pop.tournamentSelection(2, 1)
-    pop.crossover(0.05, "uniform")
-    pop.callAddDelNodes(minFeatures, maxFeatures, 0.3)
-    pop.callEdgeMutation(0.03, 0.03, True, True)
+    # one fused call for the whole operator phase: selection, crossover,
+    # add/del nodes and edge mutation run back-to-back in C++
+    pop.evolve(
+        N=2,
+        E=1,
+        crossoverProbability=0.05,
+        crossoverType="uniform",
+        minF=minFeatures,
+        maxF=maxFeatures,
+        junk=0.3,
+        probInnerNodes=0.03,
+        probStartNode=0.03,
+        justUsedNodes=True,
+        k=1,
+    )
     maxFitness = pop.bestFit
     print(maxFitness)
-    fitnessProgess.append(maxFitness)
+    fitnessProgress[g] = maxFitness
 
 pop.individuals[-1].fitness
 print(f"Start Node: {pop.individuals[-1].startNode.edges}")
@@ -47,4 +62,5 @@ for node in pop.individuals[-1].innerNodes:
         f"Type: {node.type} | Function: {node.f} Edges: {node.edges} | Boundaries: {node.boundaries}"
     )
 
+print(f"Mean best fitness: {fitnessProgress.mean()}")
 print(f"Done in: {round(time.perf_counter()-start,2)}")
@@ -84,7 +84,7 @@ int main(){
     std::vector<float> bestFitnessPerGeneration;
     int improvementCounter = 0;
     for(int g=0; g<generations; g++){
-        //generator = std::make_shared<std::mt19937_64>(5494+g);
+        //generator = std::make_shared<RandomEngine>(5494+g);
         population.accuracy(data.X,yInt,dMax,penalty);
         //population.callTraversePath(data.X, dMax);
         //for(auto& ind : population.individuals){
@@ -7,10 +7,10 @@
 
 class NetworkRemapTest : public ::testing::Test {
 protected:
-    std::shared_ptr<std::mt19937_64> generator;
+    std::shared_ptr<RandomEngine> generator;
     
     void SetUp() override {
-        generator = std::make_shared<std::mt19937_64>(42); // Fixed seed for reproducibility
+        generator = std::make_shared<RandomEngine>(42); // Fixed seed for reproducibility
     }
 };
 
@@ -21,7 +21,7 @@ protected:
 };
 
 TEST_F(AddOverhangNodesTest, TransfersOverhangNodesFromLargerToSmallerParent) {
-    auto generator = std::make_shared<std::mt19937_64>(42);
+    auto generator = std::make_shared<RandomEngine>(42);
 
     // Create two parent networks with different sizes
     Network parent1(generator, 5, 3, 5, 2, false);
@@ -46,7 +46,7 @@ TEST_F(AddOverhangNodesTest, TransfersOverhangNodesFromLargerToSmallerParent) {
 }
 
 TEST_F(AddOverhangNodesTest, NoTransferWhenEqualSizes) {
-    auto generator = std::make_shared<std::mt19937_64>(42);
+    auto generator = std::make_shared<RandomEngine>(42);
     // Create two parent networks with equal sizes
     Network parent1(generator, 5, 3, 5, 2, false);
     Network parent2(generator, 5, 3, 5, 2, false);
@@ -65,7 +65,7 @@ TEST_F(AddOverhangNodesTest, NoTransferWhenEqualSizes) {
 }
 
 TEST_F(AddOverhangNodesTest, TransfersCorrectNumberOfNodes) {
-    auto generator = std::make_shared<std::mt19937_64>(42);
+    auto generator = std::make_shared<RandomEngine>(42);
     Network parent1(generator, 5, 3, 10, 2, false);
     Network parent2(generator, 5, 3, 2, 2, false);
     
@@ -83,7 +83,7 @@ TEST_F(AddOverhangNodesTest, TransfersCorrectNumberOfNodes) {
 }
 
 TEST_F(AddOverhangNodesTest, HandlesEmptySmallerSuccessor) {
-    auto generator = std::make_shared<std::mt19937_64>(42);
+    auto generator = std::make_shared<RandomEngine>(42);
     Network parent1(generator, 5, 3, 5, 2, false);
     Network parent2(generator, 5, 3, 2, 2, false);
     
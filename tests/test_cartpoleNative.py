@@ -0,0 +1,45 @@
+import fracnetics as fn
+import sys
+
+def test_population_cartpole():
+
+    # initializing population
+    pop = fn.Population(
+        seed=42,
+        ni=10,
+        jn=5,
+        jnf=4,
+        pn=3,
+        pnf=2,
+        fractalJudgment=False,
+        nFeatureValues=[]
+    )
+
+    minF = [-4.8, -5, -0.418, -10]
+    maxF = [4.8, 5, 0.418, 10]
+    pop.setAllNodeBoundaries(minF, maxF)
+
+    try:
+        fit1 = pop.individuals[0].fitness
+        pop.cartpole(
+            dMax=10,
+            penalty=2,
+            maxSteps=500,
+            maxConsecutiveP=10
+        )
+        fit2 = pop.individuals[0].fitness
+        if fit1 == fit2:
+            print("no difference of fitness after applying cartpole()")
+            sys.exit(1)
+        for ind in pop.individuals:
+            assert ind.fitness >= 0
+
+    except Exception as e:
+        print("❌ error in pop.cartpole()")
+        print(e)
+        sys.exit(1)
+
+    print("✅ pop.cartpole()")
+
+if __name__ == "__main__":
+    test_population_cartpole()
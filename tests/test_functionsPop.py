@@ -1,5 +1,5 @@
 import fracnetics as fn
-import pandas as pd 
+import numpy as np
 import sys
 import gymnasium as gym
 
@@ -62,18 +62,16 @@ def test_population_function():
     print("✅ pop.tournamentSelection()") 
     
     try:
-        edges = []
-        for i in range(len(pop.individuals[0].innerNodes)):
-            edges.append(pop.individuals[0].innerNodes[i].edges) 
+        # edgesFlat() returns one contiguous array over the whole population,
+        # so change detection is a single vectorized compare instead of a
+        # Python loop over nodes
+        edges, offsets, _ = pop.edgesFlat()
         pop.callEdgeMutation(0.5,0)
-        counter = 0
-        for i in range(len(pop.individuals[0].innerNodes)):
-            if edges[i] != pop.individuals[0].innerNodes[i].edges:
-                counter += 1
-        if counter == 0:
+        newEdges, newOffsets, _ = pop.edgesFlat()
+        if np.array_equal(edges, newEdges) and np.array_equal(offsets, newOffsets):
             print("❌ no changes by callEdgeMutation()!")
             sys.exit(1)
- 
+
     except Exception as e:
         print("❌ error in pop.callEdgeMutation()")
         print(e)
@@ -83,15 +81,10 @@ def test_population_function():
 
     def testBoundaryMutation(testFunc, name):
         try:
-            boundaries = []
-            for i in range(len(pop.individuals[0].innerNodes)):
-                boundaries.append(pop.individuals[0].innerNodes[i].boundaries) 
+            boundaries, offsets, _ = pop.boundariesFlat()
             testFunc()
-            counter = 0
-            for i in range(len(pop.individuals[0].innerNodes)):
-                if boundaries[i] != pop.individuals[0].innerNodes[i].boundaries:
-                    counter += 1
-            if counter == 0:
+            newBoundaries, newOffsets, _ = pop.boundariesFlat()
+            if np.array_equal(boundaries, newBoundaries) and np.array_equal(offsets, newOffsets):
                 print(f"❌ no changes by {name}!")
                 sys.exit(1)
 
@@ -109,15 +102,10 @@ def test_population_function():
     testBoundaryMutation(lambda: pop.callBoundaryMutationFractal(0.8,minF,maxF), "callBoundaryMutationFractal()")
     
     try:
-        edges = []
-        for i in range(len(pop.individuals[0].innerNodes)):
-            edges.append(pop.individuals[0].innerNodes[i].edges) 
+        edges, offsets, _ = pop.edgesFlat()
         pop.crossover(0.5, type = "uniform")
-        counter = 0
-        for i in range(len(pop.individuals[0].innerNodes)):
-            if edges[i] != pop.individuals[0].innerNodes[i].edges:
-                counter += 1
-        if counter == 0:
+        newEdges, newOffsets, _ = pop.edgesFlat()
+        if np.array_equal(edges, newEdges) and np.array_equal(offsets, newOffsets):
             print("❌ no changes by crossover()!")
             sys.exit(1)
 